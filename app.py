@@ -1,7 +1,7 @@
 import streamlit as st
 import uuid
 from langchain_core.messages import HumanMessage, AIMessage
-from main import chatbot, retrieve_all_threads
+from main import get_chatbot, retrieve_all_threads
 
 # =====================================================
 # 1. PAGE CONFIG
@@ -202,7 +202,7 @@ init_state()
 # 4. HELPERS
 # =====================================================
 def load_conversation(thread_id):
-    state = chatbot.get_state(
+    state = get_chatbot().get_state(
         config={"configurable": {"thread_id": thread_id}}
     )
     messages = []
@@ -354,7 +354,7 @@ if st.session_state.pending_user_input:
             with st.chat_message("assistant"):
                 def stream_response():
                     # Stream the response from the LangGraph agent
-                    for chunk, meta in chatbot.stream(
+                    for chunk, meta in get_chatbot().stream(
                         {"messages": [HumanMessage(content=user_input)]},
                         config=CONFIG,
                         stream_mode="messages"
@@ -0,0 +1,156 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from langchain_ollama import ChatOllama
+
+from prompt import SYSTEM_PROMPT, MODEL_NAME
+from tools import TOOLS
+
+CASES_FILE = "evaluation/routing_cases.json"
+CACHE_DIR = "evaluation/.cache"
+NO_TOOL = "(no tool)"
+
+
+def prompt_hash() -> str:
+    """
+    Hash of everything the model sees besides the user message:
+    the system prompt plus each tool's name, docstring and arguments.
+    """
+    schemas = [convert_to_openai_tool(t) for t in TOOLS]
+    payload = SYSTEM_PROMPT + json.dumps(schemas, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cache_path(p_hash: str, model_name: str, message: str) -> str:
+    key = hashlib.sha256(f"{p_hash}\n{model_name}\n{message}".encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.json")
+
+
+def load_cached(path: str):
+    # A missing or unreadable cache file is treated as a miss
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def save_cached(path: str, output: dict):
+    # Write to a temp file first so an interrupted run never leaves a truncated entry
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(output, f, indent=4)
+    os.replace(tmp_path, path)
+
+
+def run_case(model, p_hash: str, model_name: str, case: dict, use_cache: bool = True) -> dict:
+    """
+    Sends one message to the model and records which tool it called.
+    Results are cached on disk so unchanged cases are not re-run.
+    """
+    path = cache_path(p_hash, model_name, case["message"])
+    output = load_cached(path) if use_cache else None
+    cached = output is not None
+    if output is None:
+        start = time.perf_counter()
+        response = model.invoke([
+            SystemMessage(content=SYSTEM_PROMPT),
+            HumanMessage(content=case["message"]),
+        ])
+        output = {
+            "tool_calls": [{"name": c["name"], "args": c["args"]} for c in response.tool_calls],
+            "latency": time.perf_counter() - start,
+        }
+        save_cached(path, output)
+
+    calls = output["tool_calls"]
+    predicted = calls[0]["name"] if calls else NO_TOOL
+    expected = case.get("expected_tool") or NO_TOOL
+    args = calls[0]["args"] if calls else {}
+
+    return {
+        "message": case["message"],
+        "expected": expected,
+        "predicted": predicted,
+        "tool_ok": predicted == expected,
+        "args_ok": predicted == expected and args_match(case.get("expected_args", {}), args),
+        "latency": output["latency"],
+        "cached": cached,
+    }
+
+
+def args_match(expected: dict, actual: dict) -> bool:
+    # Only the labeled arguments are checked; free-text ones like 'reason' vary
+    return all(
+        str(actual.get(name, "")).strip().lower() == str(value).strip().lower()
+        for name, value in expected.items()
+    )
+
+
+def print_report(results: list):
+    total = len(results)
+    tool_ok = sum(r["tool_ok"] for r in results)
+    args_ok = sum(r["args_ok"] for r in results)
+    cached = sum(r["cached"] for r in results)
+
+    print(f"\nRouting accuracy:   {tool_ok}/{total} ({tool_ok / total:.0%})")
+    print(f"Routing + args:     {args_ok}/{total} ({args_ok / total:.0%})")
+    print(f"Cached responses:   {cached}/{total}")
+
+    # Confusion between the search_* tools (rows = expected, columns = predicted)
+    search_tools = sorted(t.name for t in TOOLS if t.name.startswith("search_"))
+    columns = search_tools + ["other"]
+    print("\nSearch tool confusion (rows = expected, columns = predicted)")
+    print(" " * 24 + "".join(f"{c:>24}" for c in columns))
+    for expected in search_tools:
+        row = [r for r in results if r["expected"] == expected]
+        counts = [sum(r["predicted"] == c for r in row) for c in search_tools]
+        counts.append(len(row) - sum(counts))
+        print(f"{expected:<24}" + "".join(f"{n:>24}" for n in counts))
+
+    print("\nPer-case results")
+    for r in sorted(results, key=lambda r: r["latency"], reverse=True):
+        mark = "✅" if r["args_ok"] else ("⚠️" if r["tool_ok"] else "❌")
+        source = "cache" if r["cached"] else "live"
+        print(f"{mark} {r['latency']:6.2f}s {source:<5} {r['predicted']:<22} <- {r['message']}")
+        if not r["tool_ok"]:
+            print(f"{'':22}expected {r['expected']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline evaluation of the agent's tool routing.")
+    parser.add_argument("--model", default=MODEL_NAME)
+    parser.add_argument("--cases", default=CASES_FILE)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--no-cache", action="store_true", help="Re-run every case against the model")
+    args = parser.parse_args()
+
+    with open(args.cases, "r") as f:
+        cases = json.load(f)
+    if not cases:
+        sys.exit(f"No cases found in {args.cases}")
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    model = ChatOllama(model=args.model, temperature=0).bind_tools(TOOLS)
+    p_hash = prompt_hash()
+    print(f"Running {len(cases)} cases against {args.model} (prompt {p_hash[:12]})")
+
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        results = list(pool.map(
+            lambda case: run_case(model, p_hash, args.model, case, use_cache=not args.no_cache),
+            cases,
+        ))
+
+    print_report(results)
+
+
+if __name__ == "__main__":
+    main()
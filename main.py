@@ -1,5 +1,6 @@
 from typing import TypedDict, Annotated
 import sqlite3
+import threading
 from dotenv import load_dotenv
 
 from langgraph.graph import StateGraph, START, END
@@ -8,16 +9,28 @@ from langgraph.prebuilt import ToolNode
 from langgraph.checkpoint.sqlite import SqliteSaver
 
 from langchain_core.messages import BaseMessage, SystemMessage
-from langchain_ollama import ChatOllama
 
 from tools import TOOLS
-from prompt import SYSTEM_PROMPT
+from prompt import SYSTEM_PROMPT, MODEL_NAME
 
 load_dotenv()
 
 # Model Setup - Using a larger Qwen model if possible for better tool following
-model = ChatOllama(model="qwen3:4b", temperature=0) 
-tool_enabled_model = model.bind_tools(TOOLS)
+# The model and graph are built on first use; the locks stop concurrent
+# Streamlit sessions from building them twice.
+_tool_enabled_model = None
+_model_lock = threading.Lock()
+
+def get_tool_enabled_model():
+    global _tool_enabled_model
+    if _tool_enabled_model is None:
+        with _model_lock:
+            if _tool_enabled_model is None:
+                # Ollama client is imported on first use to keep startup light
+                from langchain_ollama import ChatOllama
+                model = ChatOllama(model=MODEL_NAME, temperature=0)
+                _tool_enabled_model = model.bind_tools(TOOLS)
+    return _tool_enabled_model
 
 class ChatState(TypedDict):
     messages: Annotated[list[BaseMessage], add_messages]
@@ -27,7 +40,7 @@ def agent_node(state: ChatState):
     input_messages = state["messages"]
     full_messages = [SystemMessage(content=SYSTEM_PROMPT)] + input_messages
     
-    response = tool_enabled_model.invoke(full_messages)
+    response = get_tool_enabled_model().invoke(full_messages)
     return {"messages": [response]}
 
 def route_tools(state: ChatState):
@@ -37,18 +50,30 @@ def route_tools(state: ChatState):
     return END
 
 # Graph Construction
-conn = sqlite3.connect("chatbot.db", check_same_thread=False)
-checkpointer = SqliteSaver(conn)
+_chatbot = None
+_chatbot_lock = threading.Lock()
+
+def get_chatbot():
+    global _chatbot
+    if _chatbot is None:
+        with _chatbot_lock:
+            if _chatbot is None:
+                _chatbot = build_chatbot()
+    return _chatbot
+
+def build_chatbot():
+    conn = sqlite3.connect("chatbot.db", check_same_thread=False)
+    checkpointer = SqliteSaver(conn)
 
-workflow = StateGraph(ChatState)
-workflow.add_node("agent", agent_node)
-workflow.add_node("tools", ToolNode(TOOLS))
+    workflow = StateGraph(ChatState)
+    workflow.add_node("agent", agent_node)
+    workflow.add_node("tools", ToolNode(TOOLS))
 
-workflow.add_edge(START, "agent")
-workflow.add_conditional_edges("agent", route_tools, {"tools": "tools", END: END})
-workflow.add_edge("tools", "agent")
+    workflow.add_edge(START, "agent")
+    workflow.add_conditional_edges("agent", route_tools, {"tools": "tools", END: END})
+    workflow.add_edge("tools", "agent")
 
-chatbot = workflow.compile(checkpointer=checkpointer)
+    return workflow.compile(checkpointer=checkpointer)
 
 def retrieve_all_threads():
     # Helper to fetch unique thread IDs from DB
@@ -0,0 +1,105 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+MARKER = "--- profiled import ---"
+
+# Imports the module in a fresh interpreter and reports wall time and peak RSS.
+# ru_maxrss is in bytes on macOS and kilobytes on Linux; Windows has no resource
+# module, so RSS is reported as None there.
+CHILD_SCRIPT = """
+import importlib, json, sys, time
+try:
+    import resource
+except ImportError:
+    resource = None
+sys.stderr.write("{marker}\\n")
+sys.stderr.flush()
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+elapsed = time.perf_counter() - start
+rss_mb = None
+if resource is not None:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss_mb = max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+print(json.dumps({"seconds": elapsed, "rss_mb": rss_mb}))
+""".replace("{marker}", MARKER)
+
+DEFAULT_MODULES = ["main", "tools", "rag.retriever"]
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def parse_importtime(stderr: str) -> list:
+    """
+    Parses `python -X importtime` output into (module, self_ms, cumulative_ms) rows,
+    skipping interpreter startup imports that happen before the profiled import.
+    """
+    rows = []
+    lines = stderr.splitlines()
+    if MARKER in lines:
+        lines = lines[lines.index(MARKER) + 1:]
+    for line in lines:
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append((name.strip(), int(self_us) / 1000, int(cumulative_us) / 1000))
+    return rows
+
+
+def profile_module(module: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD_SCRIPT, module],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing '{module}' failed:\n{result.stderr[-2000:]}")
+
+    stats = json.loads(result.stdout.strip().splitlines()[-1])
+    stats["module"] = module
+    stats["imports"] = parse_importtime(result.stderr)
+    return stats
+
+
+def print_profile(stats: dict, top: int):
+    rss = "n/a" if stats["rss_mb"] is None else f"{stats['rss_mb']:.0f} MB"
+    print(f"\n=== import {stats['module']}: {stats['seconds']:.2f}s, peak RSS {rss} ===")
+    print(f"{'cumulative ms':>14} {'self ms':>10}  module")
+    for name, self_ms, cumulative_ms in sorted(stats["imports"], key=lambda r: r[2], reverse=True)[:top]:
+        print(f"{cumulative_ms:>14.1f} {self_ms:>10.1f}  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile cold-start import time and memory of the app modules.")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--top", type=int, default=15, help="Number of slowest imports to list")
+    parser.add_argument("--budget", type=float, help="Fail if any module takes longer than this many seconds")
+    parser.add_argument("--rss-budget", type=float, help="Fail if any module uses more than this many MB")
+    args = parser.parse_args()
+
+    failures = []
+    for module in args.modules:
+        stats = profile_module(module)
+        print_profile(stats, args.top)
+
+        if args.budget is not None and stats["seconds"] > args.budget:
+            failures.append(f"{module}: {stats['seconds']:.2f}s > {args.budget:.2f}s")
+        if args.rss_budget is not None and stats["rss_mb"] is None:
+            print(f"⚠️ Peak RSS is not available on this platform; skipping --rss-budget for {module}")
+        elif args.rss_budget is not None and stats["rss_mb"] > args.rss_budget:
+            failures.append(f"{module}: {stats['rss_mb']:.0f} MB > {args.rss_budget:.0f} MB")
+
+    if failures:
+        print("\n❌ Cold start over budget:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    if args.budget is not None or args.rss_budget is not None:
+        print("\n✅ Cold start within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+# Ollama model tag, shared by the agent and the routing evaluation
+MODEL_NAME = "qwen3:4b"
+
 SYSTEM_PROMPT = """You are a helpful, professional Customer Support Agent for 'ShopSmart', an e-commerce platform.
 
 
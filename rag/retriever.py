@@ -1,18 +1,32 @@
 import os
-from langchain_community.document_loaders import PyPDFLoader, DirectoryLoader
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_community.vectorstores import FAISS
-from langchain_huggingface import HuggingFaceEmbeddings
+import threading
+
+# langchain_community, FAISS and sentence-transformers/torch are imported
+# inside the functions below so they only load when a retriever is first used.
 
 BASE_DOC_PATH = "rag/docs"
 BASE_DB_PATH = "rag/vectorstores"
 
-embeddings = HuggingFaceEmbeddings(model_name="sentence-transformers/all-mpnet-base-v2")
+_embeddings = None
+_embeddings_lock = threading.Lock()
+
+def get_embeddings():
+    global _embeddings
+    if _embeddings is None:
+        with _embeddings_lock:
+            if _embeddings is None:
+                from langchain_huggingface import HuggingFaceEmbeddings
+                _embeddings = HuggingFaceEmbeddings(model_name="sentence-transformers/all-mpnet-base-v2")
+    return _embeddings
 
 def build_vector_store(category: str):
     """
     Builds a specific vector store for a given category (e.g., 'returns', 'shipping').
     """
+    from langchain_community.document_loaders import PyPDFLoader, DirectoryLoader
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+    from langchain_community.vectorstores import FAISS
+
     source_path = os.path.join(BASE_DOC_PATH, category)
     db_path = os.path.join(BASE_DB_PATH, category)
 
@@ -32,7 +46,7 @@ def build_vector_store(category: str):
     chunks = splitter.split_documents(docs)
 
     # Create and Save local FAISS index
-    db = FAISS.from_documents(chunks, embeddings)
+    db = FAISS.from_documents(chunks, get_embeddings())
     db.save_local(db_path)
     print(f"✅ Built index for '{category}' at {db_path}")
     return db
@@ -41,6 +55,8 @@ def get_retriever(category: str):
     """
     Loads the specific vector store for the requested category.
     """
+    from langchain_community.vectorstores import FAISS
+
     db_path = os.path.join(BASE_DB_PATH, category)
     
     # Check if DB exists; if not, try to build it
@@ -49,7 +65,7 @@ def get_retriever(category: str):
         if not db:
             return None
     else:
-        db = FAISS.load_local(db_path, embeddings, allow_dangerous_deserialization=True)
+        db = FAISS.load_local(db_path, get_embeddings(), allow_dangerous_deserialization=True)
     
     return db.as_retriever(search_kwargs={'k': 3})
 
@@ -0,0 +1,70 @@
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from storage import ticket_store
+from storage.ticket_query import count_tickets_per_day, export_csv, iter_tickets, query_tickets
+
+ISSUES = [
+    "Payment was deducted but the order shows as failed",
+    "Package marked delivered but never arrived",
+    "Wrong size received, need an exchange",
+    "Refund not credited after return pickup",
+    "Unable to apply coupon at checkout",
+]
+
+
+def generate_tickets(n: int) -> list:
+    start = datetime(2026, 1, 1)
+    return [
+        {
+            "ticket_id": f"{i:08x}",
+            "issue": f"{random.choice(ISSUES)}. Order ID: {random.randint(100000, 999999)}",
+            "status": random.choice(["open", "open", "open", "closed"]),
+            "created_at": (start + timedelta(minutes=i)).isoformat(),
+        }
+        for i in range(n)
+    ]
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"{label:<32} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the ticket query API on synthetic tickets.")
+    parser.add_argument("-n", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ticket_store.TICKET_FILE = os.path.join(tmp, "tickets.json")
+        ticket_store.STATS_FILE = os.path.join(tmp, "ticket_stats.json")
+
+        tickets = generate_tickets(args.n)
+        with open(ticket_store.TICKET_FILE, "w") as f:
+            json.dump(tickets, f)
+        del tickets
+        print(f"Generated {args.n} tickets")
+
+        timed("load tickets.json (baseline)", ticket_store.load_tickets)
+        timed("build stats", ticket_store.load_ticket_stats)
+        timed("counts per day", count_tickets_per_day)
+        timed("counts per day (open, range)",
+              lambda: count_tickets_per_day("open", "2026-02-01", "2026-02-28"))
+        timed("query status + range", lambda: query_tickets("open", "2026-02-01", "2026-02-28"))
+        timed("query search", lambda: query_tickets(search="refund pickup", page=5))
+        timed("save one ticket", lambda: ticket_store.save_ticket(
+            ticket_store.create_ticket_document("Benchmark issue", "bench001")))
+        with open(os.devnull, "w") as out:
+            timed("export csv (all)", lambda: export_csv(iter_tickets(), out))
+
+
+if __name__ == "__main__":
+    main()
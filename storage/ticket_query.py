@@ -0,0 +1,158 @@
+import argparse
+import csv
+import re
+import sys
+
+from storage.ticket_store import load_tickets, load_ticket_stats
+
+EXPORT_FIELDS = ["ticket_id", "issue", "status", "created_at"]
+
+
+def tokenize(text: str) -> list:
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+
+def _matches(ticket: dict, status=None, start_date=None, end_date=None, words=None) -> bool:
+    """
+    Checks one ticket against the filters.
+    Dates are 'YYYY-MM-DD' strings and both ends are inclusive.
+    """
+    if status and ticket.get("status") != status:
+        return False
+    day = ticket.get("created_at", "")[:10]
+    if (start_date and day < start_date) or (end_date and day > end_date):
+        return False
+    if words and not words.issubset(tokenize(ticket.get("issue", ""))):
+        return False
+    return True
+
+
+def iter_tickets(status=None, start_date=None, end_date=None, search=None):
+    """
+    Yields matching tickets one at a time, oldest first.
+    `search` matches tickets whose issue contains every word in it.
+    """
+    words = set(tokenize(search)) if search else None
+    for ticket in load_tickets():
+        if _matches(ticket, status, start_date, end_date, words):
+            yield ticket
+
+
+def query_tickets(status=None, start_date=None, end_date=None, search=None, page=1, page_size=20):
+    """
+    Returns one page of tickets matching the filters, plus the total match count.
+    """
+    if page < 1 or page_size < 1:
+        raise ValueError("page and page_size must be at least 1")
+
+    offset = (page - 1) * page_size
+    total = 0
+    page_tickets = []
+    for ticket in iter_tickets(status, start_date, end_date, search):
+        if offset <= total < offset + page_size:
+            page_tickets.append(ticket)
+        total += 1
+
+    return {
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "tickets": page_tickets,
+    }
+
+
+def count_tickets_per_day(status=None, start_date=None, end_date=None) -> dict:
+    """
+    Returns {day: ticket count} from the saved stats, without loading tickets.
+    """
+    stats = load_ticket_stats()
+
+    counts = {}
+    for day in sorted(stats["by_day"]):
+        if (start_date and day < start_date) or (end_date and day > end_date):
+            continue
+        day_counts = stats["by_day"][day]
+        counts[day] = day_counts.get(status, 0) if status else sum(day_counts.values())
+    return counts
+
+
+def count_tickets_by_status() -> dict:
+    return dict(load_ticket_stats()["by_status"])
+
+
+def export_csv(tickets, out):
+    writer = csv.DictWriter(out, fieldnames=EXPORT_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    count = 0
+    for ticket in tickets:
+        writer.writerow(ticket)
+        count += 1
+    return count
+
+
+def export_parquet(tickets, path: str, batch_size: int = 10000):
+    """
+    Writes tickets to a Parquet file in batches. Requires pyarrow.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet export needs pyarrow: pip install pyarrow")
+
+    schema = pa.schema([(field, pa.string()) for field in EXPORT_FIELDS])
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        batch = []
+        for ticket in tickets:
+            batch.append(ticket)
+            if len(batch) >= batch_size:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                count += len(batch)
+                batch = []
+        if batch:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            count += len(batch)
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query and export support tickets.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_filters(p):
+        p.add_argument("--status")
+        p.add_argument("--since", dest="start_date", help="YYYY-MM-DD (inclusive)")
+        p.add_argument("--until", dest="end_date", help="YYYY-MM-DD (inclusive)")
+
+    counts = sub.add_parser("counts", help="Ticket counts per day")
+    add_filters(counts)
+
+    export = sub.add_parser("export", help="Export matching tickets to CSV or Parquet")
+    add_filters(export)
+    export.add_argument("--search")
+    export.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    export.add_argument("--out", help="Output file (CSV defaults to stdout)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "counts":
+        for day, count in count_tickets_per_day(args.status, args.start_date, args.end_date).items():
+            print(f"{day}\t{count}")
+        return
+
+    tickets = iter_tickets(args.status, args.start_date, args.end_date, args.search)
+    if args.format == "parquet":
+        if not args.out:
+            parser.error("--out is required for parquet export")
+        count = export_parquet(tickets, args.out)
+    elif args.out:
+        with open(args.out, "w", newline="") as f:
+            count = export_csv(tickets, f)
+    else:
+        count = export_csv(tickets, sys.stdout)
+    print(f"✅ Exported {count} tickets", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
 import json
 import os
+import threading
 from datetime import datetime
+from typing import Optional
 
 TICKET_FILE = "storage/tickets.json"
+STATS_FILE = "storage/ticket_stats.json"
 
 
 def save_ticket(ticket: dict):
@@ -15,6 +18,9 @@ def save_ticket(ticket: dict):
     with open(TICKET_FILE, "r") as f:
         tickets = json.load(f)
 
+    # Load the ticket counts while they still match the file on disk
+    stats = load_ticket_stats(tickets)
+
     # Add new ticket
     tickets.append(ticket)
 
@@ -22,6 +28,17 @@ def save_ticket(ticket: dict):
     with open(TICKET_FILE, "w") as f:
         json.dump(tickets, f, indent=4)
 
+    # Keep the counts in step with the ticket file
+    add_to_stats(stats, ticket)
+    _write_stats(stats)
+
+
+def load_tickets() -> list:
+    if not os.path.exists(TICKET_FILE):
+        return []
+    with open(TICKET_FILE, "r") as f:
+        return json.load(f)
+
 
 def create_ticket_document(issue: str, ticket_id: str):
     return {
@@ -30,3 +47,83 @@ def create_ticket_document(issue: str, ticket_id: str):
         "status": "open",
         "created_at": datetime.utcnow().isoformat()
     }
+
+
+# --- Ticket Counts ---
+# Totals per status and per day/status, kept in a small file next to
+# tickets.json and bumped on every save, so counts don't need the tickets.
+
+def add_to_stats(stats: dict, ticket: dict):
+    """
+    Counts a single ticket into the stats.
+    """
+    status = ticket.get("status", "open")
+    day = ticket.get("created_at", "")[:10]
+
+    stats["total"] += 1
+    stats["by_status"][status] = stats["by_status"].get(status, 0) + 1
+    day_counts = stats["by_day"].setdefault(day, {})
+    day_counts[status] = day_counts.get(status, 0) + 1
+
+
+def build_ticket_stats(tickets: list) -> dict:
+    """
+    Builds the stats from scratch for the given list of tickets.
+    """
+    stats = {"total": 0, "by_status": {}, "by_day": {}}
+    for ticket in tickets:
+        add_to_stats(stats, ticket)
+    return stats
+
+
+def load_ticket_stats(tickets: list = None) -> dict:
+    """
+    Loads the saved stats, rebuilding them if they are missing, unreadable
+    or if tickets.json was changed without going through save_ticket.
+    Pass `tickets` when they are already in memory to avoid re-reading the file.
+    """
+    stats = _read_stats()
+    if stats is not None and stats.get("source") == _ticket_file_fingerprint():
+        return stats
+
+    if tickets is None:
+        tickets = load_tickets()
+    stats = build_ticket_stats(tickets)
+    _write_stats(stats)
+    return stats
+
+
+def _read_stats() -> Optional[dict]:
+    # The stats are only derived counts, so anything unexpected is treated as missing
+    try:
+        with open(STATS_FILE, "r") as f:
+            stats = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if not (
+        isinstance(stats, dict)
+        and isinstance(stats.get("total"), int)
+        and isinstance(stats.get("by_status"), dict)
+        and isinstance(stats.get("by_day"), dict)
+        and all(isinstance(counts, dict) for counts in stats["by_day"].values())
+    ):
+        return None
+    return stats
+
+
+def _ticket_file_fingerprint() -> Optional[list]:
+    # Modification time and size of tickets.json; any write changes the mtime
+    if not os.path.exists(TICKET_FILE):
+        return None
+    info = os.stat(TICKET_FILE)
+    return [info.st_mtime_ns, info.st_size]
+
+
+def _write_stats(stats: dict):
+    # Write to a temp file first so a crash or concurrent save never leaves a truncated file
+    stats["source"] = _ticket_file_fingerprint()
+    tmp_path = f"{STATS_FILE}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(stats, f)
+    os.replace(tmp_path, STATS_FILE)
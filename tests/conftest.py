@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Run from the project root, like the app, so the modules' relative paths resolve
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
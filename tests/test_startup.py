@@ -0,0 +1,38 @@
+import pytest
+
+from profile_startup import profile_module
+
+# Cold-start budget for importing each entry point in a fresh interpreter
+COLD_START_BUDGET_SECONDS = 5.0
+COLD_START_RSS_BUDGET_MB = 300
+
+# Must only be imported on first real use, never at startup
+HEAVY_MODULES = [
+    "langchain_ollama",
+    "langchain_community",
+    "langchain_huggingface",
+    "sentence_transformers",
+    "torch",
+    "faiss",
+]
+
+REQUIRED_PACKAGES = {
+    "main": ["dotenv", "langgraph", "langgraph.checkpoint.sqlite", "langchain", "langchain_core"],
+    "tools": ["langchain", "langchain_core"],
+    "rag.retriever": [],
+}
+
+
+@pytest.mark.parametrize("module", sorted(REQUIRED_PACKAGES))
+def test_cold_start_within_budget(module):
+    # Peak RSS comes from the resource module, which Windows does not have
+    pytest.importorskip("resource")
+    for package in REQUIRED_PACKAGES[module]:
+        pytest.importorskip(package)
+
+    stats = profile_module(module)
+    imported = {name for name, _, _ in stats["imports"]}
+
+    assert stats["seconds"] <= COLD_START_BUDGET_SECONDS
+    assert stats["rss_mb"] <= COLD_START_RSS_BUDGET_MB
+    assert not imported & set(HEAVY_MODULES)
@@ -0,0 +1,79 @@
+import json
+import os
+
+import pytest
+
+from storage import ticket_store
+from storage.ticket_query import count_tickets_by_status, count_tickets_per_day, query_tickets
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(ticket_store, "TICKET_FILE", str(tmp_path / "tickets.json"))
+    monkeypatch.setattr(ticket_store, "STATS_FILE", str(tmp_path / "ticket_stats.json"))
+    ticket_store.save_ticket({"ticket_id": "a1", "issue": "Payment deducted twice",
+                              "status": "open", "created_at": "2026-01-06T07:12:42"})
+    ticket_store.save_ticket({"ticket_id": "b2", "issue": "Parcel never arrived",
+                              "status": "open", "created_at": "2026-01-07T10:49:11"})
+    return tmp_path
+
+
+def edit_tickets_by_hand(edit):
+    # Rewrite tickets.json outside save_ticket, as a later manual edit would
+    with open(ticket_store.TICKET_FILE, "r") as f:
+        tickets = json.load(f)
+    edit(tickets)
+    info = os.stat(ticket_store.TICKET_FILE)
+    with open(ticket_store.TICKET_FILE, "w") as f:
+        json.dump(tickets, f, indent=4)
+    os.utime(ticket_store.TICKET_FILE, ns=(info.st_atime_ns, info.st_mtime_ns + 1_000_000))
+
+
+def test_counts_are_updated_on_save(store):
+    assert count_tickets_by_status() == {"open": 2}
+    assert count_tickets_per_day() == {"2026-01-06": 1, "2026-01-07": 1}
+    assert count_tickets_per_day("closed") == {"2026-01-06": 0, "2026-01-07": 0}
+
+
+def test_same_size_edit_rebuilds_stats(store):
+    def edit(tickets):
+        tickets[0]["status"] = "done"
+        tickets[1]["issue"] = "x" * len(tickets[1]["issue"])
+
+    size = os.path.getsize(ticket_store.TICKET_FILE)
+    edit_tickets_by_hand(edit)
+    assert os.path.getsize(ticket_store.TICKET_FILE) == size
+
+    assert count_tickets_by_status() == {"done": 1, "open": 1}
+    assert query_tickets(search="parcel")["total"] == 0
+
+    ticket_store.save_ticket(ticket_store.create_ticket_document("Coupon not applied", "c3"))
+    assert count_tickets_by_status() == {"done": 1, "open": 2}
+
+
+def test_query_filters_and_pages(store):
+    result = query_tickets(status="open", start_date="2026-01-07")
+    assert [t["ticket_id"] for t in result["tickets"]] == ["b2"]
+
+    result = query_tickets(search="payment DEDUCTED")
+    assert result["total"] == 1 and result["tickets"][0]["ticket_id"] == "a1"
+
+    result = query_tickets(page=2, page_size=1)
+    assert result["total"] == 2 and [t["ticket_id"] for t in result["tickets"]] == ["b2"]
+
+
+@pytest.mark.parametrize("corrupt", ['{"total": 2, "by_st', "[]", '{"total": "2", "by_status": {}, "by_day": {}}'])
+def test_corrupt_stats_are_rebuilt_on_save(store, corrupt):
+    with open(ticket_store.STATS_FILE, "w") as f:
+        f.write(corrupt)
+
+    ticket_store.save_ticket(ticket_store.create_ticket_document("Coupon not applied", "c3"))
+
+    assert [t["ticket_id"] for t in ticket_store.load_tickets()] == ["a1", "b2", "c3"]
+    assert count_tickets_by_status() == {"open": 3}
+
+
+@pytest.mark.parametrize("page", [0, -1])
+def test_query_rejects_bad_page(store, page):
+    with pytest.raises(ValueError):
+        query_tickets(page=page)
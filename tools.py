@@ -1,5 +1,6 @@
 from langchain.tools import tool
 import uuid
+import threading
 from storage.ticket_store import save_ticket, create_ticket_document
 
 import re  # Added for validation
@@ -80,10 +81,16 @@ def escalate_to_human() -> str:
 from rag.retriever import get_retriever
 
 # --- Load Retrievers ---
-# We load them once at startup
-retriever_returns = get_retriever("returns")
-retriever_shipping = get_retriever("shipping")
-retriever_general = get_retriever("general")
+# Each one is loaded on its first search and reused afterwards
+_retrievers = {}
+_retrievers_lock = threading.Lock()
+
+def load_retriever(category: str):
+    if category not in _retrievers:
+        with _retrievers_lock:
+            if category not in _retrievers:
+                _retrievers[category] = get_retriever(category)
+    return _retrievers[category]
 
 # --- Define Specific Tools ---
 
@@ -92,9 +99,10 @@ def search_return_policy(query: str) -> str:
     """
     Useful for questions about refunds, returning items, money back, or exchange policies.
     """
-    if not retriever_returns:
+    retriever = load_retriever("returns")
+    if not retriever:
         return "Return policy documents are not available."
-    docs = retriever_returns.invoke(query)
+    docs = retriever.invoke(query)
     return "\n\n".join([d.page_content for d in docs])
 
 @tool
@@ -103,9 +111,10 @@ def search_shipping_policy(query: str) -> str:
     ONLY use this for delivery, tracking, shipping costs, or carrier info.
     DO NOT use for payments or returns.
     """
-    if not retriever_shipping:
+    retriever = load_retriever("shipping")
+    if not retriever:
         return "Shipping policy documents are not available."
-    docs = retriever_shipping.invoke(query)
+    docs = retriever.invoke(query)
     return "\n\n".join([d.page_content for d in docs])
 
 @tool
@@ -113,9 +122,10 @@ def search_general_faq(query: str) -> str:
     """
     Useful for general questions about the company, hours of operation, or contact info.
     """
-    if not retriever_general:
+    retriever = load_retriever("general")
+    if not retriever:
         return "FAQ documents are not available."
-    docs = retriever_general.invoke(query)
+    docs = retriever.invoke(query)
     return "\n\n".join([d.page_content for d in docs])
 
 